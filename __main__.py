@@ -1,37 +1,70 @@
+from __future__ import annotations
+
 import logging
+import logging.handlers
 import time
+from typing import TYPE_CHECKING
 
-import numpy as np
-import sounddevice as sd
-
-from silero_tts_processor import SileroTTSProcessor
+if TYPE_CHECKING:
+    import numpy as np
+    import sounddevice as sd
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("tts_server.log", encoding="utf-8"),
-    ],
-)
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+            logging.handlers.RotatingFileHandler(
+                "tts_server.log",
+                maxBytes=10 * 1024 * 1024,
+                backupCount=5,
+                encoding="utf-8",
+            ),
+        ],
+    )
 logger = logging.getLogger(__name__)
 
+# Number of samples written to the output stream at once
+PLAYBACK_CHUNK_SIZE = 4096
 
-def play_audio(audio: np.ndarray, sample_rate: int):
+
+def open_output_stream(sample_rate: int) -> sd.OutputStream:
     """
-    Play generated audio with timeout and error handling.
+    Create a mono float32 output stream that can be reused across playbacks.
 
-    :param audio: Audio numpy array
     :param sample_rate: Sample rate
+    :return: Output stream, started when used as a context manager
     """
+    import sounddevice as sd
+
+    return sd.OutputStream(
+        samplerate=sample_rate,
+        channels=1,
+        blocksize=1024,
+        dtype="float32",
+    )
+
+
+def play_audio(audio: np.ndarray, stream: sd.OutputStream):
+    """
+    Play generated audio by streaming it in chunks with error handling.
+
+    :param audio: Audio numpy array
+    :param stream: Open output stream
+    """
+    import numpy as np
+    import sounddevice as sd
+
     try:
-        sd.play(audio, sample_rate)
-        sd.wait()
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        for start in range(0, len(audio), PLAYBACK_CHUNK_SIZE):
+            stream.write(audio[start : start + PLAYBACK_CHUNK_SIZE])
     except sd.CallbackStop:
         logger.warning("Audio playback interrupted")
     except Exception as e:
-        logger.error(f"Audio playback failed: {e}")
+        logger.error("Audio playback failed: %s", e)
         raise
 
 
@@ -54,6 +87,8 @@ def main():
         </speak>
     """
 
+    from silero_tts_processor import SileroTTSProcessor
+
     try:
         tts_processor = SileroTTSProcessor(
             language_id="ru",
@@ -68,10 +103,11 @@ def main():
             output_filename=time.strftime("%Y-%m-%d_%H-%M-%S") + ".wav",
         )
 
-        play_audio(audio, tts_processor.sample_rate)
+        with open_output_stream(tts_processor.sample_rate) as stream:
+            play_audio(audio, stream)
 
     except Exception as e:
-        logging.error(f"TTS processing failed: {e}")
+        logger.error("TTS processing failed: %s", e)
         print(f"Error: {e}")
 
 
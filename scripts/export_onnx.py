@@ -0,0 +1,57 @@
+"""
+Export Silero TTS models to ONNX ahead of time.
+
+The server exports a model on first start when BACKEND=onnx; running this
+script beforehand keeps that work out of server startup and avoids several
+workers exporting the same model at once.
+
+Usage:
+    python scripts/export_onnx.py ru:v4_ru en:v3_en
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from silero_tts_processor import SileroTTSProcessor
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export Silero TTS models to ONNX")
+    parser.add_argument(
+        "models",
+        nargs="*",
+        default=["ru:v4_ru"],
+        help="language:model pairs to export (default: ru:v4_ru)",
+    )
+    parser.add_argument(
+        "--model-dir",
+        default=None,
+        help="Directory the models are cached in (default: ./tts_models)",
+    )
+    args = parser.parse_args()
+
+    models = []
+    for pair in args.models:
+        language_id, sep, model_id = pair.partition(":")
+        if not sep or not language_id or not model_id:
+            parser.error(f"invalid model {pair!r}, expected language:model")
+        models.append((language_id, model_id))
+
+    for language_id, model_id in models:
+        processor = SileroTTSProcessor(
+            language_id=language_id,
+            model_id=model_id,
+            model_dir=args.model_dir,
+            backend="onnx",
+        )
+        logger.info("Exported %s/%s to %s", language_id, model_id, processor.onnx_path)
+
+
+if __name__ == "__main__":
+    main()
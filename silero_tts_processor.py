@@ -1,23 +1,145 @@
+import contextlib
+import functools
 import logging
-from typing import Optional, Dict, List
+import logging.handlers
+import os
+import platform
+import re
+from types import MappingProxyType
+from typing import Any, Callable, Optional, Dict, Iterator, List, Mapping, Tuple, Union
 from pathlib import Path
 
 import torch
-import soundfile as sf
 import numpy as np
-from logmmse import logmmse
 
 # Configure logging with more comprehensive settings
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("tts_log.txt", encoding="utf-8"),
-    ],
-)
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+            logging.handlers.RotatingFileHandler(
+                "tts_log.txt",
+                maxBytes=10 * 1024 * 1024,
+                backupCount=5,
+                encoding="utf-8",
+            ),
+        ],
+    )
 logger = logging.getLogger(__name__)
 
+# The processor only runs inference, so autograd is never needed
+torch.set_grad_enabled(False)
+
+# SSML root element and a matcher for text that already starts with it
+_SPEAK_OPEN = "<speak>"
+_SPEAK_CLOSE = "</speak>"
+_SPEAK_RE = re.compile(r"^\s*<speak>", re.DOTALL)
+
+
+class _InputRecorder(torch.nn.Module):
+    """
+    Proxy module that records the arguments of the last call to the wrapped module.
+    """
+
+    def __init__(self, module: torch.nn.Module):
+        super().__init__()
+        self.module = module
+        self.args: Tuple[Any, ...] = ()
+        self.kwargs: Dict[str, Any] = {}
+
+    def forward(self, *args, **kwargs):
+        self.args, self.kwargs = args, kwargs
+        return self.module(*args, **kwargs)
+
+
+class _TensorInputs(torch.nn.Module):
+    """
+    Module taking only the tensor arguments of a recorded call as inputs.
+
+    Non-tensor arguments are kept from the recorded call, so the module can be
+    exported to ONNX with one graph input per tensor argument.
+    """
+
+    def __init__(self, module: torch.nn.Module, args: Tuple[Any, ...], kwargs: Dict[str, Any]):
+        super().__init__()
+        self.module = module
+        self.args = args
+        self.kwargs = kwargs
+
+    def forward(self, *tensors):
+        tensors = iter(tensors)
+        args = [next(tensors) if torch.is_tensor(a) else a for a in self.args]
+        kwargs = {
+            k: next(tensors) if torch.is_tensor(v) else v for k, v in self.kwargs.items()
+        }
+        return self.module(*args, **kwargs)
+
+
+def _call_signature(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Describe a call by its non-tensor arguments and the positions of its tensors.
+    """
+    return (
+        tuple((True, None) if torch.is_tensor(a) else (False, a) for a in args),
+        tuple(
+            (k, (True, None) if torch.is_tensor(v) else (False, v))
+            for k, v in kwargs.items()
+        ),
+    )
+
+
+class _OnnxModule:
+    """
+    Callable replacing the Silero torch module with an ONNX Runtime session.
+
+    The exported graph only takes the tensor arguments; the other arguments
+    of the recorded call are baked into it. Calls whose non-tensor arguments
+    differ from the recorded ones run on the torch module instead.
+    """
+
+    def __init__(
+        self,
+        session,
+        module: torch.nn.Module,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ):
+        self.session = session
+        self.module = module
+        self.signature = _call_signature(args, kwargs)
+        self._warned = False
+        # The exporter drops unused inputs, so feed only the ones the graph kept
+        self.input_names = [i.name for i in session.get_inputs()]
+
+    def _matches(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> bool:
+        try:
+            return bool(_call_signature(args, kwargs) == self.signature)
+        except Exception:
+            # Arguments that cannot be compared, e.g. containers of tensors
+            return False
+
+    def __call__(self, *args, **kwargs):
+        if not self._matches(args, kwargs):
+            if not self._warned:
+                logger.warning(
+                    "Model called with arguments the ONNX graph was not exported for, "
+                    "running the torch module"
+                )
+                self._warned = True
+            return self.module(*args, **kwargs)
+
+        tensors = [a for a in (*args, *kwargs.values()) if torch.is_tensor(a)]
+        feeds = {
+            f"input_{i}": tensor.detach().cpu().numpy() for i, tensor in enumerate(tensors)
+        }
+        outputs = self.session.run(
+            None, {name: feeds[name] for name in self.input_names}
+        )
+        outputs = [torch.from_numpy(output) for output in outputs]
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
 
 class SileroTTSProcessor:
     """
@@ -25,19 +147,57 @@ class SileroTTSProcessor:
     """
 
     # More comprehensive language and model configurations
-    LANGUAGE_MODELS: Dict[str, Dict[str, List[str]]] = {
-        "ru": {
-            "v4_ru": ["random", "kseniya", "baya", "aidar", "eugene", "xenia"],
-            "v3_1_ru": ["random", "kseniya", "baya", "aidar", "eugene", "xenia"],
-        },
-        "en": {
-            "v3_en": ["random", "lj"],
-            "lj_v2": ["random", "lj"],
-        },
-        "de": {
-            "v3_de": ["random", "thorsten"],
-            "thorsten_v2": ["random", "thorsten"],
-        },
+    LANGUAGE_MODELS: Mapping[str, Mapping[str, Tuple[str, ...]]] = MappingProxyType(
+        {
+            "ru": MappingProxyType(
+                {
+                    "v4_ru": ("random", "kseniya", "baya", "aidar", "eugene", "xenia"),
+                    "v3_1_ru": ("random", "kseniya", "baya", "aidar", "eugene", "xenia"),
+                }
+            ),
+            "en": MappingProxyType(
+                {
+                    "v3_en": ("random", "lj"),
+                    "lj_v2": ("random", "lj"),
+                }
+            ),
+            "de": MappingProxyType(
+                {
+                    "v3_de": ("random", "thorsten"),
+                    "thorsten_v2": ("random", "thorsten"),
+                }
+            ),
+        }
+    )
+
+    # Supported inference precisions
+    PRECISIONS: Dict[str, torch.dtype] = {
+        "bf16": torch.bfloat16,
+        "fp16": torch.float16,
+        "fp32": torch.float32,
+    }
+
+    # Supported inference backends
+    BACKENDS: List[str] = ["torch", "onnx"]
+
+    # Direct download location of Silero model packages
+    MODEL_URL: str = "https://models.silero.ai/models/tts/{language_id}/{model_id}.pt"
+
+    # Number of prepared text inputs kept by the text frontend cache
+    TEXT_CACHE_SIZE: int = 256
+
+    # Samples per block in the fused denoise and write pass
+    PROCESS_BLOCK_SIZE: int = 8192
+
+    # Intra-op threads used when none are requested; more threads only add
+    # synchronization overhead for a model of this size
+    DEFAULT_NUM_THREADS: int = 4
+
+    # Short per-language SSML used to warm up the model after loading
+    WARMUP_TEXTS: Dict[str, str] = {
+        "ru": "<speak>а</speak>",
+        "en": "<speak>a</speak>",
+        "de": "<speak>a</speak>",
     }
 
     def __init__(
@@ -46,6 +206,12 @@ class SileroTTSProcessor:
         model_id: str = "v4_ru",
         sample_rate: int = 48000,
         output_dir: Optional[str] = None,
+        quantize: bool = True,
+        precision: str = "auto",
+        compile: bool = True,
+        num_threads: Optional[int] = None,
+        model_dir: Optional[str] = None,
+        backend: str = "torch",
     ):
         """
         Initialize the TTS processor with enhanced configuration and validation.
@@ -54,25 +220,62 @@ class SileroTTSProcessor:
         :param model_id: Specific model variant
         :param sample_rate: Audio sample rate
         :param output_dir: Directory to save generated audio files
+        :param quantize: Apply INT8 dynamic quantization when running on CPU
+        :param precision: Inference precision ("auto", "bf16", "fp16" or "fp32"),
+            "auto" selects FP16 on CUDA and BF16 on CPU
+        :param compile: Compile the model with torch.compile
+        :param num_threads: Number of CPU threads used for inference
+        :param model_dir: Directory to cache downloaded models
+        :param backend: Inference backend ("torch" or "onnx")
         """
 
         self.language_id = language_id
         self.model_id = model_id
         self.sample_rate = sample_rate
+        self.quantize = quantize
+        self.precision = precision
+        self.compile = compile
+        self.backend = backend
 
         # Comprehensive input validation
         self._validate_inputs(language_id, model_id)
+        self._speakers = self.LANGUAGE_MODELS[language_id][model_id]
+        self._validate_precision(precision)
+        self._validate_backend(backend)
 
         # Create output directory if specified
         self.output_dir = Path(output_dir) if output_dir else Path.cwd() / "tts_outputs"
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_dir_str = str(self.output_dir)
+
+        # Create model cache directory
+        self.model_dir = Path(model_dir) if model_dir else Path.cwd() / "tts_models"
+        self.model_dir.mkdir(parents=True, exist_ok=True)
+
+        # Tune CPU threading before any inference runs
+        self._configure_threads(num_threads)
 
         # Improved device selection with logging
         self.device = self._select_device()
+        self.torch_dtype = self._select_dtype()
+        # Set once quantization has actually replaced layers of the model
+        self.quantized = False
+        # Exported ONNX graph, set when the onnx backend is used
+        self.onnx_path: Optional[Path] = None
 
         # Load model with retry mechanism
         self.model = self._load_model()
 
+        # Route the acoustic model through ONNX Runtime
+        if self.backend == "onnx":
+            self._export_onnx()
+
+        # Move compilation, kernel selection and allocations out of the first request
+        self._warmup()
+
+        # Check once whether apply_tts accepts several texts per call
+        self.batch_apply_tts = self._probe_batch_support()
+
     def _validate_inputs(
         self,
         language_id: str,
@@ -83,35 +286,91 @@ class SileroTTSProcessor:
 
         :raises ValueError: If inputs are invalid
         """
-        if language_id not in self.LANGUAGE_MODELS:
+        models = self.LANGUAGE_MODELS.get(language_id)
+        if models is None:
             raise ValueError(
-                f"Unsupported language. Supported: {list(self.LANGUAGE_MODELS.keys())}"
+                f"Unsupported language. Supported: {', '.join(self.LANGUAGE_MODELS)}"
             )
 
-        if model_id not in self.LANGUAGE_MODELS[language_id]:
+        if model_id not in models:
             raise ValueError(
-                f"Unsupported model for {language_id}. Supported: {list(self.LANGUAGE_MODELS[language_id].keys())}"
+                f"Unsupported model for {language_id}. Supported: {', '.join(models)}"
             )
 
     def _validate_speaker(self, speaker_id: str):
-        if speaker_id not in self.LANGUAGE_MODELS[self.language_id][self.model_id]:
+        if speaker_id not in self._speakers:
             raise ValueError(
-                f"Unsupported speaker for {self.model_id}. Supported: {self.LANGUAGE_MODELS[self.language_id][self.model_id]}"
+                f"Unsupported speaker for {self.model_id}. Supported: {', '.join(self._speakers)}"
             )
 
+    def _validate_precision(self, precision: str):
+        if precision != "auto" and precision not in self.PRECISIONS:
+            raise ValueError(
+                f"Unsupported precision. Supported: {', '.join(self.PRECISIONS)}"
+            )
+
+    def _configure_threads(self, num_threads: Optional[int]):
+        """
+        Limit CPU threading and enable the oneDNN fast paths.
+
+        :param num_threads: Number of intra-op threads, defaults to DEFAULT_NUM_THREADS
+        """
+        if num_threads is None:
+            num_threads = min(self.DEFAULT_NUM_THREADS, os.cpu_count() or 1)
+
+        torch.set_num_threads(num_threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Inter-op threads can only be set once per process
+            pass
+
+        torch.backends.mkldnn.enabled = True
+        logger.info("Using %s CPU threads", num_threads)
+
+    def _validate_backend(self, backend: str):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unsupported backend. Supported: {', '.join(self.BACKENDS)}")
+
     def _select_device(self) -> torch.device:
         """
         Intelligently select computation device with detailed logging.
 
         :return: Selected torch device
         """
+        if self.backend == "onnx":
+            logger.info("ONNX backend selected. Using CPU.")
+            return torch.device("cpu")
+
         if torch.cuda.is_available():
-            logger.info(f"CUDA available. Using GPU: {torch.cuda.get_device_name(0)}")
+            logger.info("CUDA available. Using GPU: %s", torch.cuda.get_device_name(0))
+            # Allow TF32 matmuls on Ampere+ GPUs. cuDNN benchmark mode stays off:
+            # input lengths depend on the text, so it would re-tune for every shape
+            torch.backends.cuda.matmul.allow_tf32 = True
             return torch.device("cuda")
 
         logger.info("No CUDA GPU available. Falling back to CPU.")
         return torch.device("cpu")
 
+    def _select_dtype(self) -> torch.dtype:
+        """
+        Resolve the requested precision to a dtype supported on the selected device.
+
+        :return: Selected torch dtype
+        """
+        if self.backend == "onnx":
+            return torch.float32
+
+        precision = self.precision
+        if precision == "auto":
+            precision = "fp16" if self.device.type == "cuda" else "bf16"
+
+        if precision == "fp16" and self.device.type != "cuda":
+            logger.info("FP16 is only supported on CUDA. Falling back to FP32.")
+            return torch.float32
+
+        return self.PRECISIONS[precision]
+
     def _load_model(self):
         """
         Load Silero TTS model with comprehensive error handling.
@@ -120,25 +379,693 @@ class SileroTTSProcessor:
         :raises RuntimeError: If model loading fails
         """
         try:
-            model, _ = torch.hub.load(
-                repo_or_dir="snakers4/silero-models",
-                model="silero_tts",
-                language=self.language_id,
-                speaker=self.model_id,
-            )
+            model = self._load_cached_model()
             model.to(self.device)
+            model = self._transform_model(model, lambda module: module.eval(), "eval mode")
+            model = self._cache_text_frontend(model)
+
+            if self.backend == "torch":
+                model = self._optimize_torch_model(model)
 
             logger.info(
-                f"Model successfully loaded: "
-                f"Language={self.language_id}, "
-                f"Model={self.model_id}, "
+                "Model successfully loaded: Language=%s, Model=%s",
+                self.language_id,
+                self.model_id,
             )
             return model
 
         except Exception as e:
-            logger.error(f"Model loading failed: {e}")
+            logger.error("Model loading failed: %s", e)
             raise RuntimeError(f"Could not load TTS model: {e}")
 
+    def _cache_text_frontend(self, model):
+        """
+        Memoize SSML parsing and text normalization of the Silero model.
+
+        Repeated prompts reuse the prepared model inputs instead of running
+        the text frontend again.
+
+        :param model: Loaded TTS model
+        :return: Model with a cached text frontend
+        """
+        prepare = getattr(model, "prepare_tts_model_input", None)
+        if prepare is None:
+            logger.warning("Skipping text frontend cache: no prepare_tts_model_input")
+            return model
+
+        cached_prepare = functools.lru_cache(maxsize=self.TEXT_CACHE_SIZE)(prepare)
+
+        @functools.wraps(prepare)
+        def prepare_tts_model_input(*args, **kwargs):
+            try:
+                hash((args, tuple(kwargs.items())))
+            except TypeError:
+                return prepare(*args, **kwargs)
+            return cached_prepare(*args, **kwargs)
+
+        model.prepare_tts_model_input = prepare_tts_model_input
+        return model
+
+    def _optimize_torch_model(self, model):
+        """
+        Apply quantization, precision casting, freezing and compilation for the torch backend.
+
+        Quantization and casting run before the module is frozen, since a
+        frozen module keeps its weights as graph constants.
+
+        :param model: Loaded TTS model
+        :return: Optimized model
+        """
+        if self.quantize and self.device.type == "cpu":
+            model = self._quantize_model(model)
+
+        if self.quantized:
+            # Dynamic quantization keeps FP32 activations
+            logger.info("INT8 quantization enabled. Keeping FP32 activations.")
+            self.torch_dtype = torch.float32
+        elif self.torch_dtype != torch.float32:
+            model = self._transform_model(
+                model,
+                lambda module: module.to(self.device, dtype=self.torch_dtype),
+                f"{self.torch_dtype} weights",
+            )
+
+        model = self._load_scripted_module(model)
+
+        if self.compile:
+            model = self._transform_model(
+                model,
+                lambda module: torch.compile(
+                    module,
+                    mode="reduce-overhead",
+                    fullgraph=False,
+                    dynamic=True,
+                ),
+                "torch.compile",
+            )
+
+        return model
+
+    def _load_scripted_module(self, model):
+        """
+        Swap in a frozen TorchScript module optimized for inference.
+
+        optimize_for_inference fuses Conv+BN+ReLU and folds constants. The
+        optimized module only keeps ``forward``, so it is used only after a
+        test synthesis succeeds with it; otherwise the unfrozen module is kept.
+        Validated modules are saved to the model directory, keyed by device and
+        precision, and reused on later loads.
+
+        :param model: Loaded TTS model
+        :return: Model backed by the optimized TorchScript module
+        """
+        if self.quantized:
+            mode = "int8"
+        else:
+            mode = {dtype: name for name, dtype in self.PRECISIONS.items()}[self.torch_dtype]
+        script_path = (
+            self.model_dir
+            / f"silero_{self.language_id}_{self.model_id}_{self.device.type}_{mode}.ts"
+        )
+
+        if script_path.exists():
+
+            def load(module: torch.nn.Module) -> torch.nn.Module:
+                scripted = torch.jit.load(str(script_path), map_location=self.device)
+                try:
+                    self._check_module(model, scripted)
+                except Exception:
+                    # Drop the broken module so it is rebuilt below
+                    script_path.unlink(missing_ok=True)
+                    raise
+                return scripted
+
+            original = getattr(model, "model", model)
+            model = self._transform_model(model, load, "cached TorchScript module")
+            if getattr(model, "model", model) is not original:
+                return model
+
+        def optimize(module: torch.nn.Module) -> torch.nn.Module:
+            if not isinstance(module, torch.jit.ScriptModule):
+                module = torch.jit.script(module)
+            optimized = torch.jit.optimize_for_inference(module)
+            self._check_module(model, optimized)
+            self._write_cache_file(script_path, optimized.save)
+            return optimized
+
+        return self._transform_model(model, optimize, "TorchScript inference optimization")
+
+    def _write_cache_file(self, path: Path, write: Callable[[str], None]):
+        """
+        Write a file to the model directory under a temporary name and move it into place.
+
+        Processes loading the same model concurrently never see a partly written file.
+
+        :param path: Final path of the file
+        :param write: Function writing the file to the path it is given
+        """
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            write(str(temp_path))
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def _check_module(self, model, module: torch.nn.Module):
+        """
+        Run a test synthesis with a candidate torch module swapped into the model.
+
+        The model's own module is restored afterwards.
+
+        :param model: Loaded TTS model
+        :param module: Candidate torch module
+        :raises Exception: If the synthesis fails with the candidate module
+        """
+        if not hasattr(model, "model"):
+            return
+
+        original = model.model
+        model.model = module
+        try:
+            with torch.inference_mode():
+                self._synthesize(
+                    self.WARMUP_TEXTS[self.language_id], self._speakers[1], model=model
+                )
+        finally:
+            model.model = original
+
+    def _export_onnx(self):
+        """
+        Export the acoustic model to ONNX and run it with ONNX Runtime.
+
+        Inputs for the export are recorded from a warmup synthesis. Text
+        processing stays in the Silero wrapper, only the torch module it calls
+        is replaced. The exported graph is cached in the model directory.
+
+        :raises RuntimeError: If onnxruntime is not installed or export fails
+        """
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise RuntimeError("The onnx backend requires the onnxruntime package") from e
+
+        onnx_path = self.model_dir / f"silero_{self.language_id}_{self.model_id}.onnx"
+        speaker_id = self._speakers[1]
+        module = self.model.model
+
+        try:
+            recorder = _InputRecorder(module)
+            self.model.model = recorder
+            self._synthesize(self.WARMUP_TEXTS[self.language_id], speaker_id)
+
+            if not onnx_path.exists():
+                tensors = tuple(
+                    a
+                    for a in (*recorder.args, *recorder.kwargs.values())
+                    if torch.is_tensor(a)
+                )
+                input_names = [f"input_{i}" for i in range(len(tensors))]
+                self._write_cache_file(
+                    onnx_path,
+                    lambda path: torch.onnx.export(
+                        _TensorInputs(module, recorder.args, recorder.kwargs),
+                        tensors,
+                        path,
+                        input_names=input_names,
+                        dynamic_axes={
+                            name: list(range(tensor.dim()))
+                            for name, tensor in zip(input_names, tensors)
+                        },
+                        opset_version=17,
+                    ),
+                )
+                logger.info("Model exported to %s", onnx_path)
+
+            options = onnxruntime.SessionOptions()
+            options.graph_optimization_level = (
+                onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+            )
+            options.intra_op_num_threads = torch.get_num_threads()
+            session = onnxruntime.InferenceSession(
+                str(onnx_path),
+                sess_options=options,
+                providers=["CPUExecutionProvider"],
+            )
+            self.model.model = _OnnxModule(session, module, recorder.args, recorder.kwargs)
+            self.onnx_path = onnx_path
+            logger.info("Using ONNX Runtime backend")
+
+        except Exception as e:
+            self.model.model = module
+            logger.error("ONNX export failed: %s", e)
+            raise RuntimeError(f"Could not export TTS model to ONNX: {e}")
+
+    def _load_cached_model(self):
+        """
+        Load the model package from the local cache, downloading it on first use.
+
+        Falls back to torch.hub if the package cannot be downloaded or imported.
+
+        :return: Loaded TTS model
+        """
+        model_path = self.model_dir / f"silero_{self.language_id}_{self.model_id}.pt"
+
+        try:
+            if not model_path.exists():
+                logger.info("Downloading model to %s", model_path)
+                torch.hub.download_url_to_file(
+                    self.MODEL_URL.format(
+                        language_id=self.language_id,
+                        model_id=self.model_id,
+                    ),
+                    str(model_path),
+                )
+
+            importer = torch.package.PackageImporter(str(model_path))
+            return importer.load_pickle("tts_models", "model")
+
+        except Exception as e:
+            logger.warning("Cached model unavailable, using torch.hub: %s", e)
+
+        torch.hub.set_dir(str(self.model_dir / "hub"))
+        model, _ = torch.hub.load(
+            repo_or_dir="snakers4/silero-models",
+            model="silero_tts",
+            language=self.language_id,
+            speaker=self.model_id,
+            force_reload=False,
+            trust_repo=True,
+        )
+        return model
+
+    def _transform_model(
+        self,
+        model,
+        transform: Callable[[torch.nn.Module], torch.nn.Module],
+        description: str,
+    ):
+        """
+        Apply a transformation to the torch module backing the model.
+
+        Silero models are wrappers holding a TorchScript module in their
+        ``model`` attribute, so the transformation is applied to that module.
+        If it fails, the model is returned unchanged.
+
+        :param model: Loaded TTS model
+        :param transform: Function returning the transformed torch module
+        :param description: Transformation name used in log messages
+        :return: Model backed by the transformed module
+        """
+        if isinstance(model, torch.nn.Module):
+            module = model
+        else:
+            module = getattr(model, "model", None)
+
+        if not isinstance(module, torch.nn.Module):
+            logger.warning("Skipping %s: no torch module found", description)
+            return model
+
+        try:
+            transformed = transform(module)
+        except Exception as e:
+            logger.warning("Skipping %s: %s", description, e)
+            return model
+
+        logger.info("Applied %s", description)
+        if module is model:
+            return transformed
+
+        model.model = transformed
+        return model
+
+    def _quantize_model(self, model):
+        """
+        Quantize linear and recurrent layers to INT8 for faster CPU inference.
+
+        TorchScript modules expose no ``nn.Linear``/``nn.LSTM`` instances to
+        swap, so quantization is only considered applied if it replaced at
+        least one layer. Sets ``self.quantized`` accordingly.
+
+        :param model: Loaded TTS model
+        :return: Quantized model, or the original one if nothing was quantized
+        """
+        engines = torch.backends.quantized.supported_engines
+        engine = "qnnpack" if platform.machine().lower() in ("arm64", "aarch64") else "fbgemm"
+        if engine in engines:
+            torch.backends.quantized.engine = engine
+
+        def quantize(module: torch.nn.Module) -> torch.nn.Module:
+            quantized = torch.quantization.quantize_dynamic(
+                module,
+                {torch.nn.Linear, torch.nn.LSTM, torch.nn.GRU},
+                dtype=torch.qint8,
+            )
+            swapped = sum(
+                type(child).__module__.startswith("torch.ao.nn.quantized.dynamic")
+                for child in quantized.modules()
+            )
+            if not swapped:
+                raise ValueError("no quantizable layers found")
+
+            logger.info("Quantized %s layers to INT8", swapped)
+            self.quantized = True
+            return quantized
+
+        return self._transform_model(model, quantize, "INT8 dynamic quantization")
+
+    def _warmup(self):
+        """
+        Run a short synthesis so that lazy initialization happens at load time.
+
+        This covers compilation, cuDNN initialization and workspace
+        allocation. Falls back to the eager model if the compiled one fails to run.
+        """
+        speaker_id = self._speakers[1]
+
+        try:
+            with torch.inference_mode():
+                self._synthesize(self.WARMUP_TEXTS[self.language_id], speaker_id)
+
+            if self.device.type == "cuda":
+                torch.cuda.synchronize()
+                torch.cuda.empty_cache()
+
+            logger.info("Model warmup completed")
+        except Exception as e:
+            logger.warning("Model warmup failed: %s", e)
+            if self.compile:
+                self.model = self._transform_model(
+                    self.model,
+                    lambda module: getattr(module, "_orig_mod", module),
+                    "eager fallback",
+                )
+
+    def _apply_tts(self, text: Union[str, List[str]], speaker_id: str, model=None):
+        """
+        Run the TTS model on prepared SSML text under autocast.
+
+        :param text: SSML text, or a list of them for batched models
+        :param speaker_id: Speaker name
+        :param model: TTS model to run, defaults to the loaded one
+        :return: Raw model output
+        """
+        if model is None:
+            model = self.model
+
+        with torch.autocast(
+            device_type=self.device.type,
+            dtype=self.torch_dtype,
+            enabled=self.torch_dtype != torch.float32,
+        ):
+            return model.apply_tts(
+                ssml_text=text,
+                speaker=speaker_id,
+                sample_rate=self.sample_rate,
+                put_accent=True,
+                put_yo=True,
+            )
+
+    def _synthesize(self, text: str, speaker_id: str, model=None) -> torch.Tensor:
+        """
+        Run the TTS model on prepared SSML text.
+
+        :param text: SSML text
+        :param speaker_id: Speaker name
+        :param model: TTS model to run, defaults to the loaded one
+        :return: Generated audio tensor in float32
+        """
+        return self._apply_tts(text, speaker_id, model=model).float()
+
+    def _denoise_blocks(
+        self,
+        audio: np.ndarray,
+        initial_noise: int = 3,
+        window_size: int = 50,
+        noise_threshold: float = 0.25,
+    ) -> Iterator[np.ndarray]:
+        """
+        Reduce background noise with a log-MMSE estimator, one block of samples at a time.
+
+        Each block is transformed together with surrounding context frames so
+        its samples match a whole-signal STFT. The noise estimate starts from
+        the leading frames and is refined with every frame the likelihood ratio
+        marks as noise as blocks are processed.
+
+        :param audio: Audio samples, time is the last axis
+        :param initial_noise: Number of leading frames used for the noise estimate
+        :param window_size: STFT window size in samples
+        :param noise_threshold: Speech presence level below which frames count as noise
+        :return: Iterator over denoised blocks along the last axis
+        """
+        import scipy.signal
+        import scipy.special
+
+        num_samples = audio.shape[-1]
+        if num_samples < window_size:
+            yield audio.astype(np.float32, copy=False)
+            return
+
+        stft_params = dict(
+            fs=self.sample_rate,
+            window="hann",
+            nperseg=window_size,
+            noverlap=window_size // 2,
+            nfft=2 * window_size,
+        )
+        # Blocks and context are whole hops so block frames align with global frames
+        hop = window_size - window_size // 2
+        context = 2 * hop
+        block_size = max(hop, self.PROCESS_BLOCK_SIZE // hop * hop)
+        ksi_min = 10 ** (-25 / 10)
+        initial = None
+        noise_sum = noise_count = 0
+
+        for start in range(0, num_samples, block_size):
+            segment_start = max(start - context, 0)
+            segment_end = min(start + block_size + context, num_samples)
+            _, _, spectrum = scipy.signal.stft(
+                audio[..., segment_start:segment_end], **stft_params
+            )
+            power = np.abs(spectrum) ** 2
+            eps = np.finfo(power.dtype).eps
+
+            # Initial noise estimate from the leading frames
+            if initial is None:
+                initial = power[..., :initial_noise].mean(axis=-1, keepdims=True) + eps
+
+            # Refine the estimate with every frame the likelihood ratio marks as noise
+            gamma = np.minimum(power / initial, 40)
+            xi = np.maximum(gamma - 1, ksi_min)
+            log_sigma = gamma * xi / (1 + xi) - np.log1p(xi)
+            is_noise = log_sigma.sum(axis=-2, keepdims=True) * 2 / window_size < noise_threshold
+            noise_sum = noise_sum + (power * is_noise).sum(axis=-1, keepdims=True)
+            noise_count = noise_count + is_noise.sum(axis=-1, keepdims=True)
+            noise = np.where(
+                noise_count > 0,
+                noise_sum / np.maximum(noise_count, 1) + eps,
+                initial,
+            )
+
+            # Log-MMSE spectral gain applied to the whole (bins, frames) matrix,
+            # reusing the intermediate buffers
+            gamma = np.minimum(np.divide(power, noise, out=power), 40, out=power)
+            xi = np.maximum(gamma - 1, ksi_min, out=log_sigma)
+            a = np.divide(xi, 1 + xi, out=xi)
+            v = np.maximum(np.multiply(a, gamma, out=gamma), eps, out=gamma)
+            gain = np.multiply(a, np.exp(0.5 * scipy.special.exp1(v)), out=a)
+            spectrum *= gain
+
+            _, enhanced = scipy.signal.istft(spectrum, **stft_params)
+            offset = start - segment_start
+            length = min(block_size, num_samples - start)
+            yield enhanced[..., offset : offset + length].astype(np.float32, copy=False)
+
+    def _enhance_noise(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Reduce background noise of the whole signal.
+
+        :param audio: Audio samples, time is the last axis
+        :return: Denoised audio with the same shape as the input
+        """
+        return np.concatenate(list(self._denoise_blocks(audio)), axis=-1)
+
+    def _process_and_write(
+        self,
+        audio: np.ndarray,
+        enhance_noise: bool,
+        output_filename: Optional[str],
+    ) -> np.ndarray:
+        """
+        Denoise audio and write it as 16-bit PCM in a single pass over the samples.
+
+        Each block is denoised, converted and written while it is still in
+        cache instead of materializing the full signal at every step.
+
+        :param audio: Mono audio samples
+        :param enhance_noise: Apply noise reduction
+        :param output_filename: Optional filename inside the output directory
+        :return: Processed audio array
+        """
+        import soundfile as sf
+
+        if not enhance_noise and not output_filename:
+            return audio
+
+        if enhance_noise:
+            blocks = self._denoise_blocks(audio)
+            processed = np.empty(len(audio), dtype=np.float32)
+        else:
+            blocks = (
+                audio[start : start + self.PROCESS_BLOCK_SIZE]
+                for start in range(0, len(audio), self.PROCESS_BLOCK_SIZE)
+            )
+            processed = audio
+
+        with contextlib.ExitStack() as stack:
+            output_file = None
+            if output_filename:
+                output_path = os.path.join(self._output_dir_str, output_filename)
+                output_file = stack.enter_context(
+                    sf.SoundFile(
+                        output_path,
+                        "w",
+                        samplerate=self.sample_rate,
+                        channels=1,
+                        subtype="PCM_16",
+                    )
+                )
+
+            position = 0
+            for block in blocks:
+                if enhance_noise:
+                    processed[position : position + len(block)] = block
+                position += len(block)
+
+                if output_file is not None:
+                    output_file.write(
+                        np.clip(block * 32767, -32768, 32767).astype(np.int16)
+                    )
+
+        if output_filename:
+            logger.info("Audio saved to %s", output_path)
+
+        return processed
+
+    def _prepare_text(self, text: str) -> str:
+        """
+        Wrap plain text into SSML.
+
+        :param text: Input text or SSML
+        :return: SSML text
+        """
+        match = _SPEAK_RE.match(text)
+
+        # if text is not SSML, convert it to SSML
+        if match is None:
+            return f"{_SPEAK_OPEN}{text.strip()}{_SPEAK_CLOSE}"
+
+        # drop leading whitespace only, the SSML parser ignores trailing whitespace
+        return text[match.end() - len(_SPEAK_OPEN) :]
+
+    def save_audio(self, audio: np.ndarray, output_filename: str):
+        """
+        Save audio to the output directory as 16-bit PCM WAV.
+
+        The format is set explicitly, so the filename may use any suffix
+        (e.g. a temporary ``.partial`` file that is renamed once written).
+
+        :param audio: Audio numpy array
+        :param output_filename: Filename inside the output directory
+        """
+        import soundfile as sf
+
+        output_path = os.path.join(self._output_dir_str, output_filename)
+        with sf.SoundFile(
+            output_path,
+            "w",
+            samplerate=self.sample_rate,
+            channels=1,
+            format="WAV",
+            subtype="PCM_16",
+        ) as f:
+            f.write(audio.astype(np.float32, copy=False))
+        logger.info("Audio saved to %s", output_path)
+
+    def _probe_batch_support(self) -> bool:
+        """
+        Check whether the model synthesizes a list of texts in one apply_tts call.
+
+        :return: True if batched calls return one audio per text
+        """
+        text = self.WARMUP_TEXTS[self.language_id]
+
+        try:
+            with torch.inference_mode():
+                output = self._apply_tts([text, text], self._speakers[1])
+        except torch.cuda.OutOfMemoryError:
+            raise
+        except (TypeError, ValueError, AttributeError, AssertionError, RuntimeError) as e:
+            logger.info("Batched apply_tts unsupported: %s", e)
+            return False
+
+        if self._split_batch(output, 2) is None:
+            logger.info("Batched apply_tts unsupported: unexpected output")
+            return False
+
+        logger.info("Batched apply_tts supported")
+        return True
+
+    def _split_batch(self, output, count: int) -> Optional[List[torch.Tensor]]:
+        """
+        Split the output of a batched apply_tts call into one audio per text.
+
+        Padded outputs are only accepted together with the audio lengths, which
+        are used to trim the padding.
+
+        :param output: Raw model output
+        :param count: Number of texts in the batch
+        :return: Audio tensors in float32, or None if the output is not a batch
+        """
+        if (
+            isinstance(output, tuple)
+            and len(output) == 2
+            and all(torch.is_tensor(o) for o in output)
+            and output[0].dim() == 2
+            and output[1].dim() == 1
+        ):
+            audios, lengths = output
+            if len(audios) != count or len(lengths) != count:
+                return None
+            return [audio[:length].float() for audio, length in zip(audios, lengths.tolist())]
+
+        if (
+            isinstance(output, (list, tuple))
+            and len(output) == count
+            and all(torch.is_tensor(audio) and audio.dim() == 1 for audio in output)
+        ):
+            return [audio.float() for audio in output]
+
+        return None
+
+    def _synthesize_batch(self, texts: List[str], speaker_id: str) -> List[torch.Tensor]:
+        """
+        Run the TTS model on several SSML texts at once.
+
+        Uses a single apply_tts call when the model accepts a list of texts and
+        one call per text otherwise.
+
+        :param texts: SSML texts
+        :param speaker_id: Speaker name
+        :return: Generated audio tensors in float32, one per text
+        """
+        if self.batch_apply_tts and len(texts) > 1:
+            audios = self._split_batch(self._apply_tts(texts, speaker_id), len(texts))
+            if audios is not None:
+                return audios
+            logger.warning("Unexpected batched apply_tts output, synthesizing texts one by one")
+
+        return [self._synthesize(text, speaker_id) for text in texts]
+
     def generate_speech(
         self,
         text: str,
@@ -158,40 +1085,67 @@ class SileroTTSProcessor:
             # Validate speaker
             self._validate_speaker(speaker_id)
 
-            # strip text from leading and trailing whitespace
-            text = text.strip()
+            text = self._prepare_text(text)
 
-            # if text is not SSML, convert it to SSML
-            if not text.startswith("<speak>"):
-                text = f"<speak>{text}</speak>"
+            with torch.inference_mode():
+                # Generate audio, viewing the CPU tensor as an array without copying
+                audio = self._synthesize(text, speaker_id).detach().cpu().numpy()
 
-            # Generate audio
-            audio = self.model.apply_tts(
-                ssml_text=text,
-                speaker=speaker_id,
-                sample_rate=self.sample_rate,
-                put_accent=True,
-                put_yo=True,
-            )
+                # Optional noise enhancement and saving in one pass
+                audio = self._process_and_write(audio, enhance_noise, output_filename)
 
-            # Optional noise enhancement
-            if enhance_noise:
-                audio = logmmse(
-                    np.asarray(audio),
-                    self.sample_rate,
-                    initial_noise=3,
-                    window_size=50,
-                    noise_threshold=0.25,
-                )
+            return audio
 
-            # Save audio if filename provided
-            if output_filename:
-                output_path = self.output_dir / output_filename
-                sf.write(str(output_path), audio, self.sample_rate)
-                logger.info(f"Audio saved to {output_path}")
+        except Exception as e:
+            logger.error("Speech generation failed: %s", e)
+            raise
 
-            return audio
+    def generate_speech_batch(
+        self,
+        texts: List[str],
+        speaker_id: str = "xenia",
+        enhance_noise: bool = True,
+        output_filenames: Optional[List[str]] = None,
+    ) -> List[np.ndarray]:
+        """
+        Generate speech for several texts with the same speaker in one pass.
+
+        :param texts: Input texts or SSML
+        :param speaker_id: Speaker name
+        :param enhance_noise: Apply noise reduction
+        :param output_filenames: Optional filenames for saving audio, one per text
+        :return: Generated audio arrays, one per text
+        """
+        try:
+            # Validate speaker
+            self._validate_speaker(speaker_id)
+
+            if output_filenames is not None and len(output_filenames) != len(texts):
+                raise ValueError("Number of output filenames must match number of texts")
+
+            texts = [self._prepare_text(text) for text in texts]
+
+            with torch.inference_mode():
+                audios = [
+                    audio.detach().cpu().numpy()
+                    for audio in self._synthesize_batch(texts, speaker_id)
+                ]
+
+                # Denoise all utterances with a single call over a padded batch
+                if enhance_noise and audios:
+                    lengths = [len(audio) for audio in audios]
+                    padded = np.zeros((len(audios), max(lengths)), dtype=np.float32)
+                    for row, audio in zip(padded, audios):
+                        row[: len(audio)] = audio
+                    enhanced = self._enhance_noise(padded)
+                    audios = [row[:length] for row, length in zip(enhanced, lengths)]
+
+                if output_filenames:
+                    for audio, output_filename in zip(audios, output_filenames):
+                        self.save_audio(audio, output_filename)
+
+            return audios
 
         except Exception as e:
-            logger.error(f"Speech generation failed: {e}")
+            logger.error("Batch speech generation failed: %s", e)
             raise
@@ -1,42 +1,540 @@
 import os
-import json
+
+# OpenMP/MKL size their thread pools when first loaded, so the per-worker
+# thread count must be exported before numpy or torch are imported. The
+# default is capped like SileroTTSProcessor.DEFAULT_NUM_THREADS (importing it
+# here would load torch too early): more threads only add synchronization
+# overhead for a model of this size.
+_MAX_DEFAULT_THREADS = 4
+_workers = int(os.getenv("TTS_WORKERS", 1)) or os.cpu_count() or 1
+_torch_threads = os.getenv("TORCH_THREADS") or str(
+    max(1, min(_MAX_DEFAULT_THREADS, (os.cpu_count() or 1) // _workers))
+)
+os.environ.setdefault("OMP_NUM_THREADS", _torch_threads)
+os.environ.setdefault("MKL_NUM_THREADS", _torch_threads)
+
+import asyncio
+import atexit
+import collections
+import concurrent.futures
+import functools
+import hashlib
 import logging
+import logging.handlers
+import multiprocessing
+import threading
 import uuid
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
+import msgspec
+import orjson
 import soundfile as sf
 import tornado.ioloop
+import tornado.iostream
 import tornado.web
 import tornado.httpserver
+import tornado.netutil
 import tornado.options
+import tornado.process
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
 
 from silero_tts_processor import SileroTTSProcessor
 
 # Configure logging with more robust configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("tts_server.log", encoding="utf-8", mode="a"),
-    ],
-)
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+            logging.handlers.RotatingFileHandler(
+                "tts_server.log",
+                maxBytes=10 * 1024 * 1024,
+                backupCount=5,
+                encoding="utf-8",
+            ),
+        ],
+    )
 logger = logging.getLogger(__name__)
 
+# Size of the chunks audio files are streamed in
+AUDIO_CHUNK_SIZE = 256 * 1024
+
+# Seconds between checks for a file another worker is still writing
+AUDIO_POLL_INTERVAL = 0.05
+
+
+# Processor options for each TTS_QUANTIZE setting
+QUANTIZE_OPTIONS: Dict[str, Dict[str, Any]] = {
+    # FP32 whenever INT8 quantization cannot be applied, e.g. on CUDA or when
+    # the model has no quantizable layers
+    "int8": {"quantize": True, "precision": "fp32"},
+    "bf16": {"quantize": False, "precision": "bf16"},
+    "fp16": {"quantize": False, "precision": "fp16"},
+    "none": {"quantize": False, "precision": "fp32"},
+}
+
 
 # Use environment variables with type conversion and default values
 class Config:
     PORT: int = int(os.getenv("PORT", 8765))
     LANGUAGE_ID: str = os.getenv("LANGUAGE_ID", "ru")
     MODEL_ID: str = os.getenv("MODEL_ID", "v4_ru")
+    # Comma-separated "language:model" pairs loaded at startup
+    SUPPORTED_MODELS: List[Tuple[str, ...]] = [
+        tuple(part.strip() for part in pair.split(":", 1))
+        for pair in os.getenv("SUPPORTED_MODELS", f"{LANGUAGE_ID}:{MODEL_ID}").split(",")
+        if pair.strip()
+    ]
     OUTPUT_DIR: Path = Path(os.getenv("OUTPUT_DIR", "tts_outputs")).resolve()
+    TTS_CONCURRENCY: int = int(os.getenv("TTS_CONCURRENCY", 1))
+    MAX_BATCH_SIZE: int = int(os.getenv("MAX_BATCH_SIZE", 8))
+    BATCH_WAIT_MS: int = int(os.getenv("BATCH_WAIT_MS", 20))
+    MAX_QUEUE_WAIT_MS: int = int(os.getenv("MAX_QUEUE_WAIT_MS", 5000))
+    TTS_CACHE: int = int(os.getenv("TTS_CACHE", 256))
+    AUDIO_WAIT_S: float = float(os.getenv("AUDIO_WAIT_S", 10))
+    # Server processes, each with its own models; 0 starts one per CPU
+    WORKERS: int = int(os.getenv("TTS_WORKERS", 1))
+    # Model precision: int8 (dynamic quantization), bf16, fp16 or none (fp32)
+    QUANTIZE: str = os.getenv("TTS_QUANTIZE", "int8").lower()
+    # Intra-op threads per worker, defaults to the CPUs divided between
+    # workers, at most 4
+    TORCH_THREADS: int = int(_torch_threads)
+    # Inference backend: torch or onnx (ONNX Runtime on CPU)
+    BACKEND: str = os.getenv("BACKEND", "torch")
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+    # Request bodies above MAX_BODY bytes are rejected before they are read
+    MAX_BODY: int = int(os.getenv("MAX_BODY", 64 * 1024))
+    MAX_TEXT_CHARS: int = int(os.getenv("MAX_TEXT_CHARS", 5000))
 
     @classmethod
     def validate(cls):
         """Validate configuration settings"""
+        if cls.QUANTIZE not in QUANTIZE_OPTIONS:
+            raise ValueError(
+                f"Unsupported TTS_QUANTIZE {cls.QUANTIZE!r}. "
+                f"Supported: {', '.join(QUANTIZE_OPTIONS)}"
+            )
+
+        if not cls.SUPPORTED_MODELS:
+            raise ValueError("SUPPORTED_MODELS must list at least one language:model pair")
+        for pair in cls.SUPPORTED_MODELS:
+            if len(pair) != 2 or not all(pair):
+                raise ValueError(
+                    f"Invalid SUPPORTED_MODELS entry {':'.join(pair)!r}, "
+                    "expected language:model"
+                )
+
         cls.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Output directory: {cls.OUTPUT_DIR}")
+        logger.info("Output directory: %s", cls.OUTPUT_DIR)
+
+
+class TTSRequest(msgspec.Struct):
+    """Schema of the /tts request body"""
+
+    text: str
+    speaker: str = "xenia"
+    enhance_noise: bool = True
+    language: str = Config.LANGUAGE_ID
+    model: str = Config.MODEL_ID
+
+
+# Reused decoder that parses and type-checks request bodies in one pass
+_request_decoder = msgspec.json.Decoder(TTSRequest)
+
+# The success response has a fixed shape, so it is formatted directly as bytes
+_SUCCESS_TMPL = b'{"success":true,"filename":"%s","duration":%.6f,"ready":%s}'
+# Error responses only vary in status and message; the message is JSON-escaped
+_ERR_TMPL = b'{"success":false,"status_code":%d,"error":%s}'
+
+
+# Inference runs off the event loop in a thread pool sized to the configured
+# concurrency
+_tts_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=Config.TTS_CONCURRENCY, thread_name_prefix="tts"
+)
+_io_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="io"
+)
+
+
+# Generated files and their durations keyed by a hash of the synthesis
+# parameters, in LRU order
+_synth_cache: "collections.OrderedDict[bytes, Tuple[str, float]]" = collections.OrderedDict()
+_synth_cache_lock = threading.Lock()
+
+
+def _synth_cache_key(
+    language: str, model: str, text: str, speaker: str, enhance_noise: bool
+) -> bytes:
+    """Hash the parameters that determine the generated audio"""
+    return hashlib.blake2b(
+        f"{language}|{model}|{speaker}|{enhance_noise}|{text}".encode(),
+        digest_size=16,
+    ).digest()
+
+
+def _synth_cache_get(key: bytes) -> Optional[Tuple[str, float]]:
+    """Return the cached filename and duration for a key and mark it as recently used"""
+    with _synth_cache_lock:
+        entry = _synth_cache.get(key)
+        if entry is not None:
+            _synth_cache.move_to_end(key)
+        return entry
+
+
+def _synth_cache_put(key: bytes, filename: str, duration: float) -> None:
+    """Cache a generated filename, deleting the least recently used file when full"""
+    if Config.TTS_CACHE <= 0:
+        return
+
+    with _synth_cache_lock:
+        _synth_cache[key] = (filename, duration)
+        while len(_synth_cache) > Config.TTS_CACHE:
+            _, (evicted, _) = _synth_cache.popitem(last=False)
+            if evicted in _pending_writes:
+                # Still being written; deleted once the write finishes
+                _evicted_writes.add(evicted)
+                continue
+            try:
+                os.unlink(Config.OUTPUT_DIR / evicted)
+            except FileNotFoundError:
+                pass
+
+
+# Audio files this worker is still writing, keyed by filename; the event is
+# set once the file has been renamed into place (or the write failed). Other
+# workers see the "<filename>.partial" file instead.
+_pending_writes: Dict[str, asyncio.Event] = {}
+
+# Pending files evicted from the cache before their write finished
+_evicted_writes: Set[str] = set()
+
+
+def _partial_filename(filename: str) -> str:
+    """Name of the file audio is written to before it is moved into place"""
+    return f"{filename}.partial"
+
+
+def _write_audio(processor: SileroTTSProcessor, audio: Any, filename: str) -> None:
+    """Write audio to a temporary file and atomically move it into place"""
+    partial = _partial_filename(filename)
+    try:
+        processor.save_audio(audio, partial)
+        os.replace(Config.OUTPUT_DIR / partial, Config.OUTPUT_DIR / filename)
+    except BaseException:
+        try:
+            os.unlink(Config.OUTPUT_DIR / partial)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+async def _persist_audio(
+    processor: SileroTTSProcessor, audio: Any, filename: str, cache_key: bytes
+) -> None:
+    """
+    Start writing audio in the background; readers wait on the registered event
+
+    Returns once the partial file exists, so any worker can tell the file is
+    on its way before the client is answered.
+    """
+    event = asyncio.Event()
+    _pending_writes[filename] = event
+    io_loop = tornado.ioloop.IOLoop.current()
+
+    try:
+        await io_loop.run_in_executor(
+            _io_executor, (Config.OUTPUT_DIR / _partial_filename(filename)).touch
+        )
+    except BaseException:
+        _pending_writes.pop(filename, None)
+        event.set()
+        raise
+
+    def _on_written(future: asyncio.Future) -> None:
+        _pending_writes.pop(filename, None)
+        event.set()
+        if filename in _evicted_writes:
+            _evicted_writes.discard(filename)
+            try:
+                os.unlink(Config.OUTPUT_DIR / filename)
+            except FileNotFoundError:
+                pass
+        if future.exception() is not None:
+            logger.error("Failed to write %s: %s", filename, future.exception())
+            with _synth_cache_lock:
+                _synth_cache.pop(cache_key, None)
+
+    future = io_loop.run_in_executor(_io_executor, _write_audio, processor, audio, filename)
+    future.add_done_callback(_on_written)
+
+
+# Synthesis tasks in progress keyed like the cache, with the number of requests
+# awaiting each; identical concurrent requests share a single task
+_synth_inflight: Dict[bytes, List[Any]] = {}
+
+
+async def _synthesize_shared(
+    key: bytes, synthesize: Callable[[], Awaitable[Tuple[str, float]]]
+) -> Tuple[str, float]:
+    """
+    Await the synthesis for a cache key, starting it if none is in flight
+
+    The shared task is cancelled once every request awaiting it is cancelled.
+
+    Args:
+        key (bytes): Synthesis cache key
+        synthesize (Callable): Starts the synthesis if no task is in flight
+
+    Returns:
+        Tuple of the output filename and the audio duration in seconds
+    """
+    entry = _synth_inflight.get(key)
+    if entry is None or entry[0].cancelled():
+        task = asyncio.ensure_future(synthesize())
+        entry = _synth_inflight[key] = [task, 0]
+
+        def _on_done(_: asyncio.Future, entry: List[Any] = entry) -> None:
+            # A newer task may have replaced this one after a cancellation
+            if _synth_inflight.get(key) is entry:
+                del _synth_inflight[key]
+
+        task.add_done_callback(_on_done)
+
+    task = entry[0]
+    entry[1] += 1
+    try:
+        return await asyncio.shield(task)
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0 and not task.done():
+            task.cancel()
+            # Later requests for the key must start a new task
+            if _synth_inflight.get(key) is entry:
+                del _synth_inflight[key]
+
+
+async def _synthesize_to_file(
+    processor: SileroTTSProcessor, data: "TTSRequest", cache_key: bytes, max_wait: float
+) -> Tuple[str, float]:
+    """Synthesize through the request pool, start writing the file and cache it"""
+    audio = await tts_pool.submit(
+        processor,
+        data.text,
+        data.speaker,
+        data.enhance_noise,
+        max_wait,
+    )
+    filename = uuid.uuid4().hex + ".wav"
+    duration = len(audio) / processor.sample_rate
+
+    await _persist_audio(processor, audio, filename, cache_key)
+    _synth_cache_put(cache_key, filename, duration)
+
+    return filename, duration
+
+
+class _PoolItem(NamedTuple):
+    processor: SileroTTSProcessor
+    text: str
+    speaker: str
+    enhance_noise: bool
+    deadline: float
+    future: asyncio.Future
+
+
+class TTSRequestPool:
+    """
+    Coalesce concurrent TTS requests into micro-batches.
+
+    A batch is only collected once an inference slot is free, so requests
+    queued while inference runs are merged into the next batch. Each batch
+    holds requests with the same processor, speaker and noise enhancement and
+    is synthesized with a single generate_speech_batch call; other requests
+    wait in a backlog for a later batch. A semaphore limits the batches
+    running at once to the configured concurrency instead of letting them
+    compete for CPU cores.
+
+    Create the pool after the event loop policy is installed, so its asyncio
+    primitives are bound to the loop that serves requests.
+    """
+
+    def __init__(self, max_batch_size: int = 8, max_wait: float = 0.02, concurrency: int = 1):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.semaphore = asyncio.Semaphore(concurrency)
+        # Queued requests that did not match the group of an earlier batch
+        self.backlog: "collections.deque[_PoolItem]" = collections.deque()
+
+    def start(self) -> None:
+        """Start the background coalescer on the current IOLoop"""
+        tornado.ioloop.IOLoop.current().spawn_callback(self._run)
+
+    def submit(
+        self,
+        processor: SileroTTSProcessor,
+        text: str,
+        speaker: str,
+        enhance_noise: bool,
+        max_wait: float,
+    ) -> asyncio.Future:
+        """
+        Queue a synthesis request
+
+        Args:
+            processor (SileroTTSProcessor): Processor of the requested model
+            text (str): Input text or SSML
+            speaker (str): Speaker name
+            enhance_noise (bool): Apply noise reduction
+            max_wait (float): Seconds the request may wait before inference starts
+
+        Returns:
+            Future resolved with the generated audio array, failed with
+            TimeoutError if the request waited too long; cancel it to drop
+            the request before inference
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.queue.put_nowait(
+            _PoolItem(
+                processor,
+                text,
+                speaker,
+                enhance_noise,
+                loop.time() + max_wait,
+                future,
+            )
+        )
+        return future
+
+    async def _run(self) -> None:
+        """Wait for a free inference slot, then collect and dispatch the next batch"""
+        while True:
+            await self.semaphore.acquire()
+            try:
+                items = await self._collect_batch()
+            except BaseException:
+                self.semaphore.release()
+                raise
+
+            tornado.ioloop.IOLoop.current().spawn_callback(self._run_batch, items)
+
+    @staticmethod
+    def _group_key(item: _PoolItem) -> Tuple[SileroTTSProcessor, str, bool]:
+        return item.processor, item.speaker, item.enhance_noise
+
+    async def _collect_batch(self) -> List[_PoolItem]:
+        """
+        Collect requests of one group until the batch is full or the window ends
+
+        The batch takes the group of the oldest request. Everything already
+        queued is considered first; requests of other groups are kept in the
+        backlog in arrival order.
+        """
+        loop = asyncio.get_running_loop()
+        first = self.backlog.popleft() if self.backlog else await self.queue.get()
+        key = self._group_key(first)
+        batch = [first]
+
+        def take(item: _PoolItem) -> None:
+            if len(batch) < self.max_batch_size and self._group_key(item) == key:
+                batch.append(item)
+            else:
+                self.backlog.append(item)
+
+        for _ in range(len(self.backlog)):
+            take(self.backlog.popleft())
+        while not self.queue.empty():
+            take(self.queue.get_nowait())
+
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                take(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run_batch(self, items: List[_PoolItem]) -> None:
+        """Synthesize a batch in the inference executor and release its slot"""
+        try:
+            items = self._drop_stale(items)
+            if not items:
+                return
+
+            processor, speaker, enhance_noise = self._group_key(items[0])
+            io_loop = tornado.ioloop.IOLoop.current()
+            try:
+                audios = await io_loop.run_in_executor(
+                    _tts_executor,
+                    functools.partial(
+                        processor.generate_speech_batch,
+                        [item.text for item in items],
+                        speaker_id=speaker,
+                        enhance_noise=enhance_noise,
+                    ),
+                )
+            except Exception as e:
+                if len(items) == 1:
+                    if not items[0].future.done():
+                        items[0].future.set_exception(e)
+                    return
+
+                # One bad text fails the whole batch; retry one by one so
+                # every request only gets its own error
+                logger.warning("Batch of %s failed, retrying one by one: %s", len(items), e)
+                for item in items:
+                    if item.future.done():
+                        continue
+                    try:
+                        audio = await io_loop.run_in_executor(
+                            _tts_executor,
+                            functools.partial(
+                                processor.generate_speech,
+                                item.text,
+                                speaker_id=speaker,
+                                enhance_noise=enhance_noise,
+                            ),
+                        )
+                    except Exception as item_error:
+                        if not item.future.done():
+                            item.future.set_exception(item_error)
+                    else:
+                        if not item.future.done():
+                            item.future.set_result(audio)
+                return
+
+            for item, audio in zip(items, audios):
+                if not item.future.done():
+                    item.future.set_result(audio)
+        finally:
+            self.semaphore.release()
+
+    def _drop_stale(self, items: List[_PoolItem]) -> List[_PoolItem]:
+        """Fail expired requests and skip cancelled ones before running inference"""
+        now = asyncio.get_running_loop().time()
+        pending = []
+
+        for item in items:
+            if item.future.done():
+                continue
+            if now > item.deadline:
+                item.future.set_exception(TimeoutError("Request timed out in queue"))
+                continue
+            pending.append(item)
+
+        return pending
 
 
 class BaseHandler(tornado.web.RequestHandler):
@@ -45,7 +543,9 @@ class BaseHandler(tornado.web.RequestHandler):
     def set_default_headers(self) -> None:
         self.set_header("Content-Type", "application/json")
         self.set_header("Access-Control-Allow-Origin", "*")
-        self.set_header("Access-Control-Allow-Headers", "Content-Type")
+        self.set_header(
+            "Access-Control-Allow-Headers", "Content-Type, X-Request-Deadline-Ms"
+        )
         self.set_header("Access-Control-Allow-Methods", "POST, GET, OPTIONS")
 
     def write_error(self, status_code: int, **kwargs: Any) -> None:
@@ -56,17 +556,24 @@ class BaseHandler(tornado.web.RequestHandler):
             status_code (int): HTTP status code
             kwargs (dict): Additional error information
         """
-        error_message = self._get_error_message(kwargs)
+        self._finish_error(self._get_error_message(kwargs), status_code)
 
-        error_response = {
-            "success": False,
-            "status_code": status_code,
-            "error": error_message,
-        }
+    def _finish_json(self, body: bytes, status_code: int = 200) -> None:
+        """
+        Send a complete JSON response in a single write
 
+        Args:
+            body (bytes): Serialized JSON
+            status_code (int): HTTP status code
+        """
         self.set_status(status_code)
-        self.write(json.dumps(error_response))
-        self.finish()
+        self.set_header("Content-Type", "application/json")
+        self.set_header("Content-Length", len(body))
+        self.finish(body)
+
+    def _finish_error(self, message: str, status_code: int) -> None:
+        """Send a JSON error response"""
+        self._finish_json(_ERR_TMPL % (status_code, orjson.dumps(message)), status_code)
 
     def _get_error_message(self, kwargs: Dict[str, Any]) -> str:
         """Extract error message from exception"""
@@ -76,12 +583,19 @@ class BaseHandler(tornado.web.RequestHandler):
 
 
 class TTSHandler(BaseHandler):
+    _future: Optional[asyncio.Future] = None
+
+    def on_connection_close(self) -> None:
+        """Drop the queued request when the client disconnects"""
+        if self._future is not None:
+            self._future.cancel()
+
     def options(self) -> None:
         """Handle CORS preflight requests"""
         self.set_status(204)
         self.finish()
 
-    def post(self) -> None:
+    async def post(self) -> None:
         """
         Handle TTS generation request
 
@@ -89,69 +603,120 @@ class TTSHandler(BaseHandler):
         {
             "text": str (required),
             "speaker": str (optional, default="xenia"),
-            "enhance_noise": bool (optional, default=True)
+            "enhance_noise": bool (optional, default=True),
+            "language": str (optional, default=LANGUAGE_ID),
+            "model": str (optional, default=MODEL_ID)
         }
         """
         try:
             data = self._parse_request_data()
-            filename = self._generate_speech(data)
-            self._send_success_response(filename)
+            filename, duration = await self._generate_speech(data)
+            self._send_success_response(
+                filename, duration, filename not in _pending_writes
+            )
+        except asyncio.CancelledError:
+            logger.info("Client disconnected before speech was generated")
         except ValueError as ve:
             self._handle_validation_error(ve)
+        except TimeoutError as te:
+            self._handle_queue_timeout(te)
         except Exception as e:
             self._handle_generation_error(e)
 
-    def _parse_request_data(self) -> Dict[str, Any]:
+    def _parse_request_data(self) -> TTSRequest:
         """Parse and validate request data"""
-        data = json.loads(self.request.body)
-        text = data.get("text", "").strip()
+        try:
+            data = _request_decoder.decode(self.request.body)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid request: {e}") from e
 
+        text = data.text.strip()
         if not text:
             raise ValueError("Text is required and cannot be empty")
+        if len(text) > Config.MAX_TEXT_CHARS:
+            raise ValueError(f"Text is too long (max {Config.MAX_TEXT_CHARS} characters)")
 
-        return {
-            "text": text,
-            "speaker": data.get("speaker", "xenia"),
-            "enhance_noise": data.get("enhance_noise", True),
-        }
+        return msgspec.structs.replace(data, text=text)
 
-    def _generate_speech(self, data: Dict[str, Any]) -> str:
-        """Generate speech and return filename"""
-        filename = f"{uuid.uuid4()}.wav"
+    async def _generate_speech(self, data: TTSRequest) -> Tuple[str, float]:
+        """
+        Generate speech through the request pool
+
+        The WAV file is written in the background, so the returned filename
+        may not be readable yet.
 
-        audio = tts_processor.generate_speech(
-            data["text"],
-            speaker_id=data["speaker"],
-            enhance_noise=data["enhance_noise"],
-            output_filename=filename,
+        Returns:
+            Tuple of the output filename and the audio duration in seconds
+        """
+        processor = tts_processors.get((data.language, data.model))
+        if processor is None:
+            raise ValueError(
+                f"Unsupported model {data.language}/{data.model}. "
+                f"Supported: {', '.join(f'{lang}/{model}' for lang, model in tts_processors)}"
+            )
+
+        cache_key = _synth_cache_key(
+            data.language,
+            data.model,
+            data.text,
+            data.speaker,
+            data.enhance_noise,
+        )
+        cached = _synth_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        max_wait_ms = self._get_max_wait_ms()
+
+        # Identical requests in flight share one synthesis and output file
+        self._future = asyncio.ensure_future(
+            _synthesize_shared(
+                cache_key,
+                functools.partial(
+                    _synthesize_to_file, processor, data, cache_key, max_wait_ms / 1000
+                ),
+            )
         )
+        return await self._future
 
-        return filename
+    def _get_max_wait_ms(self) -> int:
+        """Milliseconds the request may wait in the queue, from X-Request-Deadline-Ms"""
+        header = self.request.headers.get("X-Request-Deadline-Ms")
+        if header is None:
+            return Config.MAX_QUEUE_WAIT_MS
 
-    def _send_success_response(self, filename: str) -> None:
+        try:
+            return max(int(header), 0)
+        except ValueError:
+            raise ValueError(
+                "X-Request-Deadline-Ms must be an integer number of milliseconds"
+            ) from None
+
+    def _send_success_response(self, filename: str, duration: float, ready: bool) -> None:
         """Send successful TTS generation response"""
-        response = {
-            "success": True,
-            "filename": filename,
-        }
-        self.write(json.dumps(response))
-        self.set_status(200)
+        # Filenames are generated server-side (hex + ".wav"), so no escaping is needed
+        self._finish_json(
+            _SUCCESS_TMPL % (filename.encode(), duration, b"true" if ready else b"false")
+        )
 
     def _handle_validation_error(self, error: ValueError) -> None:
         """Handle input validation errors"""
-        logger.error(f"Validation Error: {error}")
-        self.set_status(400)
-        self.write(json.dumps({"success": False, "error": str(error)}))
+        logger.error("Validation Error: %s", error)
+        self._finish_error(str(error), 400)
+
+    def _handle_queue_timeout(self, error: TimeoutError) -> None:
+        """Handle requests that waited in the queue past their deadline"""
+        logger.error("Queue Timeout: %s", error)
+        self._finish_error("queue timeout", 503)
 
     def _handle_generation_error(self, error: Exception) -> None:
         """Handle TTS generation errors"""
-        logger.error(f"TTS Generation Error: {error}")
-        self.set_status(500)
-        self.write(json.dumps({"success": False, "error": str(error)}))
+        logger.error("TTS Generation Error: %s", error)
+        self._finish_error(str(error), 500)
 
 
 class AudioFileHandler(BaseHandler):
-    def get(self, filename: str) -> None:
+    async def get(self, filename: str) -> None:
         """
         Serve audio file by filename
 
@@ -159,42 +724,146 @@ class AudioFileHandler(BaseHandler):
             filename (str): Name of the audio file to serve
         """
         try:
-            filepath = self._validate_file(filename)
-            self._serve_audio_file(filepath, filename)
+            await self._wait_until_written(filename)
+            filepath, size = self._validate_file(filename)
+            await self._serve_audio_file(filepath, filename, size)
+        except tornado.iostream.StreamClosedError:
+            logger.info("Client closed connection while downloading %s", filename)
+        except ValueError as ve:
+            self._handle_invalid_filename(ve)
         except FileNotFoundError as fnf:
             self._handle_file_not_found(fnf)
+        except asyncio.TimeoutError as te:
+            self._handle_not_ready(te)
         except Exception as e:
             self._handle_serving_error(e)
 
-    def _validate_file(self, filename: str) -> Path:
-        """Validate and return file path"""
-        filepath = Config.OUTPUT_DIR / filename
-
-        if not filepath.exists():
-            raise FileNotFoundError(f"Audio file {filename} not found")
+    async def _wait_until_written(self, filename: str) -> None:
+        """Wait for a background write of the file to complete"""
+        event = _pending_writes.get(filename)
+        if event is not None:
+            await asyncio.wait_for(event.wait(), Config.AUDIO_WAIT_S)
+            return
+
+        # The file may be written by another worker; wait for the rename
+        partial = Config.OUTPUT_DIR / _partial_filename(filename)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + Config.AUDIO_WAIT_S
+        while partial.exists():
+            if loop.time() >= deadline:
+                raise asyncio.TimeoutError(f"Audio file {filename} is still being written")
+            await asyncio.sleep(AUDIO_POLL_INTERVAL)
+
+    def _validate_file(self, filename: str) -> Tuple[Path, int]:
+        """Validate the file path and return it with the file size"""
+        if filename.endswith(".partial"):
+            raise ValueError(f"Invalid audio filename {filename}")
+
+        filepath = (Config.OUTPUT_DIR / filename).resolve()
+        if Config.OUTPUT_DIR not in filepath.parents:
+            raise ValueError(f"Invalid audio filename {filename}")
 
-        return filepath
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Audio file {filename} not found") from None
+
+        return filepath, stat.st_size
+
+    async def _serve_audio_file(self, filepath: Path, filename: str, size: int) -> None:
+        """Set headers and stream the requested byte range in bounded chunks"""
+        byte_range = self._parse_range(size)
+        if byte_range is None:
+            self.set_status(416)
+            self.set_header("Content-Range", f"bytes */{size}")
+            self.finish()
+            return
+
+        start, end = byte_range
+        if end - start != size:
+            self.set_status(206)
+            self.set_header(
+                "Content-Range", f"bytes {start}-{end - 1}/{size}"
+            )
 
-    def _serve_audio_file(self, filepath: Path, filename: str) -> None:
-        """Set headers and serve audio file"""
         self.set_header("Content-Type", "audio/wav")
         self.set_header("Content-Disposition", f"attachment; filename={filename}")
+        self.set_header("Accept-Ranges", "bytes")
+        self.set_header("Content-Length", end - start)
 
+        io_loop = tornado.ioloop.IOLoop.current()
+        remaining = end - start
         with open(filepath, "rb") as f:
-            self.write(f.read())
+            f.seek(start)
+            while remaining > 0:
+                chunk = await io_loop.run_in_executor(
+                    _io_executor, f.read, min(AUDIO_CHUNK_SIZE, remaining)
+                )
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                self.write(chunk)
+                await self.flush()
         self.finish()
 
+    def _parse_range(self, size: int) -> Optional[Tuple[int, int]]:
+        """
+        Resolve the Range header against the file size
+
+        Args:
+            size (int): File size in bytes
+
+        Returns:
+            Half-open (start, end) byte range to send, the whole file when no
+            valid Range header is present, or None if the range is unsatisfiable
+        """
+        # Only a single "bytes=first-last" or "bytes=-suffix" range is
+        # supported; other headers are ignored and the whole file is sent
+        unit, _, spec = self.request.headers.get("Range", "").partition("=")
+        first, dash, last = spec.strip().partition("-")
+        if unit.strip().lower() != "bytes" or not dash or "," in spec:
+            return 0, size
+
+        try:
+            if not first:
+                suffix = int(last)
+                if suffix < 0:
+                    return 0, size
+                if suffix == 0:
+                    return None
+                return max(size - suffix, 0), size
+
+            start = int(first)
+            end = int(last) + 1 if last else None
+        except ValueError:
+            return 0, size
+
+        if start < 0 or (end is not None and end <= start):
+            return 0, size
+        if start >= size:
+            return None
+
+        return start, min(end, size) if end is not None else size
+
+    def _handle_invalid_filename(self, error: ValueError) -> None:
+        """Handle filenames that resolve outside the output directory"""
+        logger.error("Invalid Filename: %s", error)
+        self._finish_error(str(error), 400)
+
     def _handle_file_not_found(self, error: FileNotFoundError) -> None:
         """Handle file not found errors"""
-        logger.error(f"File Not Found: {error}")
-        self.set_status(404)
-        self.write(json.dumps({"success": False, "error": str(error)}))
+        logger.error("File Not Found: %s", error)
+        self._finish_error(str(error), 404)
+
+    def _handle_not_ready(self, error: asyncio.TimeoutError) -> None:
+        """Handle files that are still being written after the wait limit"""
+        logger.error("Audio File Not Ready: %s", error)
+        self._finish_error("audio file not ready", 503)
 
     def _handle_serving_error(self, error: Exception) -> None:
         """Handle audio file serving errors"""
-        logger.error(f"Audio File Serving Error: {error}")
-        self.set_status(500)
-        self.write(json.dumps({"success": False, "error": str(error)}))
+        logger.error("Audio File Serving Error: %s", error)
+        self._finish_error(str(error), 500)
 
 
 class IndexHandler(tornado.web.RequestHandler):
@@ -205,7 +874,43 @@ class IndexHandler(tornado.web.RequestHandler):
         self.render("./static/index.html")
 
 
-def make_app() -> tornado.web.Application:
+def _start_log_listener() -> "multiprocessing.Queue":
+    """
+    Write log records from a background thread in this process
+
+    The current root handlers are moved to a QueueListener, so console and
+    file writes happen off the event loop and forked workers do not write to
+    the log file themselves.
+
+    Returns:
+        Queue that workers send their log records to
+    """
+    log_queue = multiprocessing.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    listener.start()
+
+    owner = os.getpid()
+
+    def _stop_listener() -> None:
+        # Forked workers inherit this hook but not the listener thread
+        if os.getpid() == owner:
+            listener.stop()
+
+    atexit.register(_stop_listener)
+    return log_queue
+
+
+def _log_to_queue(log_queue: "multiprocessing.Queue") -> None:
+    """Replace the root handlers with a single handler feeding the listener"""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def make_app(debug: bool = True) -> tornado.web.Application:
     """Create Tornado web application"""
     return tornado.web.Application(
         [
@@ -213,34 +918,65 @@ def make_app() -> tornado.web.Application:
             (r"/tts", TTSHandler),
             (r"/audio/([^/]+)", AudioFileHandler),
         ],
-        debug=True,
+        debug=debug,
         default_handler_class=BaseHandler,
     )
 
 
 def main() -> None:
     """Main server startup method"""
+    if uvloop is not None:
+        uvloop.install()
+
+    logging.getLogger().setLevel(Config.LOG_LEVEL)
+
     # Validate configuration before starting
     Config.validate()
 
-    # Create TTS processor with configuration
-    global tts_processor
-    tts_processor = SileroTTSProcessor(
-        language_id=Config.LANGUAGE_ID,
-        model_id=Config.MODEL_ID,
-        output_dir=Config.OUTPUT_DIR,
+    # The listener must run in the parent before forking; records are only
+    # queued after the fork, as a queue that was used cannot be shared
+    log_queue = _start_log_listener()
+
+    # Bind in the parent so all workers accept on the same sockets, then fork
+    # before any model is loaded so each worker owns a private copy
+    sockets = tornado.netutil.bind_sockets(Config.PORT)
+    if Config.WORKERS != 1:
+        tornado.process.fork_processes(Config.WORKERS)
+    _log_to_queue(log_queue)
+
+    # Preload one warmed-up TTS processor per supported model
+    global tts_processors
+    tts_processors = {
+        (language_id, model_id): SileroTTSProcessor(
+            language_id=language_id,
+            model_id=model_id,
+            output_dir=Config.OUTPUT_DIR,
+            num_threads=Config.TORCH_THREADS,
+            backend=Config.BACKEND,
+            **QUANTIZE_OPTIONS[Config.QUANTIZE],
+        )
+        for language_id, model_id in Config.SUPPORTED_MODELS
+    }
+
+    # Batch concurrent requests into single model calls
+    global tts_pool
+    tts_pool = TTSRequestPool(
+        max_batch_size=Config.MAX_BATCH_SIZE,
+        max_wait=Config.BATCH_WAIT_MS / 1000,
+        concurrency=Config.TTS_CONCURRENCY,
     )
+    tts_pool.start()
 
-    # Create application and server
-    app = make_app()
-    server = tornado.httpserver.HTTPServer(app)
+    # Create application and server; autoreload does not work with forked workers
+    app = make_app(debug=Config.WORKERS == 1)
+    server = tornado.httpserver.HTTPServer(app, max_body_size=Config.MAX_BODY)
 
     try:
-        server.listen(Config.PORT)
-        logger.info(f"TTS Server running on http://localhost:{Config.PORT}")
+        server.add_sockets(sockets)
+        logger.info("TTS Server running on http://localhost:%s", Config.PORT)
         tornado.ioloop.IOLoop.current().start()
     except Exception as e:
-        logger.error(f"Failed to start server: {e}")
+        logger.error("Failed to start server: %s", e)
         raise
 
 